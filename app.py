@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import hmac
 import os
 from datetime import datetime, timedelta, timezone, time
 from pathlib import Path
+from time import monotonic, time_ns
 from typing import List
 
 from functools import wraps
-from collections import OrderedDict
+from itertools import groupby
 
+import bcrypt
+import orjson
 from flask import (
     Flask,
     abort,
@@ -20,8 +24,13 @@ from flask import (
     session,
     url_for,
 )
-from sqlalchemy import func
-from werkzeug.security import check_password_hash, generate_password_hash
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+from sqlalchemy import case, event, func, insert, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import contains_eager
+from werkzeug.security import check_password_hash
 
 from models import (
     ActivityLog,
@@ -29,14 +38,70 @@ from models import (
     Task,
     User,
     db,
+    naive_utc_to_ist_datetime,
+    naive_utc_to_ist_string,
+    to_epoch,
     to_ist_datetime,
-    to_ist_string,
-    to_utc_iso,
+    utcnow,
     IST,
 )
 
 
 BASE_DIR = Path(__file__).resolve().parent
+FRAGMENT_CACHE_TTL = 30  # seconds
+TASKS_VERSION_TTL = 3600  # seconds; must outlive FRAGMENT_CACHE_TTL
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", 12))
+
+MONTH_LABEL_FORMAT = "%B %Y"
+DAY_LABEL_FORMAT = "%d %b %Y (%A)"
+TIME_LABEL_FORMAT = "%I:%M %p"
+
+cache = Cache()
+
+
+def _password_bytes(password: str) -> bytes:
+    # bcrypt only considers the first 72 bytes; newer releases raise instead.
+    return password.encode("utf-8")[:72]
+
+
+def hash_password(password: str) -> str:
+    return bcrypt.hashpw(
+        _password_bytes(password), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("ascii")
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    if password_hash.startswith("$2"):
+        return bcrypt.checkpw(_password_bytes(password), password_hash.encode("ascii"))
+    # Accounts created before the switch to bcrypt still carry Werkzeug hashes.
+    return check_password_hash(password_hash, password)
+
+
+# Verified against when no account matches, so unknown identifiers cost the
+# same bcrypt work as real ones and response time does not reveal usernames.
+_DUMMY_PASSWORD_HASH = hash_password("dummy-password-for-timing")
+
+
+def password_needs_rehash(password_hash: str) -> bool:
+    if not password_hash.startswith("$2"):
+        return True
+    return int(password_hash.split("$")[2]) < BCRYPT_ROUNDS
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    # Naive datetimes are stored as UTC, so orjson emits them with a +00:00
+    # offset, matching the ISO strings the API returned before.
+    options = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = self.options | orjson.OPT_SORT_KEYS if self.sort_keys else self.options
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        # The session serializer passes object_hook, which orjson does not support.
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
 
 
 def ensure_admin_user() -> None:
@@ -45,15 +110,48 @@ def ensure_admin_user() -> None:
         admin = User(
             username="admin",
             email=None,
-            password_hash=generate_password_hash("Cycerzzz"),
+            password_hash=hash_password("Cycerzzz"),
             is_admin=True,
         )
         db.session.add(admin)
         db.session.commit()
 
 
+def ensure_indexes() -> None:
+    # create_all() skips tables that already exist, including their indexes,
+    # so add any indexes introduced after the tables were first created.
+    for model in (Task, PomodoroSession):
+        for index in model.__table__.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+
+def engine_options(db_url: str) -> dict:
+    # SQLite connections are local files; pooling and pre-ping only matter for
+    # networked databases such as Postgres or MySQL.
+    if make_url(db_url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_pre_ping": True,
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 20)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 30)),
+        "pool_recycle": 1800,
+    }
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers run alongside the writer, and with WAL synchronous=NORMAL
+    # stays crash-safe while skipping the fsync on every commit.
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 def create_app() -> Flask:
     app = Flask(__name__, template_folder="templates", static_folder="static")
+    app.json = ORJSONProvider(app)
     app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-secret-change-me")
 
     primary_db_url = os.environ.get(
@@ -63,17 +161,37 @@ def create_app() -> Flask:
 
     app.config["SQLALCHEMY_DATABASE_URI"] = primary_db_url
     app.config["SQLALCHEMY_BINDS"] = {
-        "auth": auth_db_url,
+        "auth": {"url": auth_db_url, **engine_options(auth_db_url)},
     }
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(primary_db_url)
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
+    # The default file cache is shared by every gunicorn worker on the host, so
+    # a tasks version bump is seen by all of them. Use CACHE_TYPE=RedisCache
+    # (with CACHE_REDIS_URL) when running on several hosts.
+    app.config.setdefault("CACHE_TYPE", os.environ.get("CACHE_TYPE", "FileSystemCache"))
+    app.config.setdefault("CACHE_DIR", os.environ.get("CACHE_DIR", str(BASE_DIR / ".cache")))
+
     db.init_app(app)
+    cache.init_app(app)
+    with app.app_context():
+        engines = db.engines
+        if auth_db_url == primary_db_url:
+            # Share one engine so a request's task and activity writes go
+            # through a single connection and COMMIT. Separate connections to
+            # one SQLite file would also block each other on the write lock.
+            engines["auth"].dispose()
+            engines["auth"] = engines[None]
+        for engine in set(engines.values()):
+            if engine.dialect.name == "sqlite":
+                event.listen(engine, "connect", set_sqlite_pragmas)
 
     auto_init = os.environ.get("INIT_DB_ON_STARTUP", "true").lower() == "true"
     if auto_init:
         with app.app_context():
             db.create_all()
             db.create_all(bind_key="auth")
+            ensure_indexes()
             ensure_admin_user()
 
     register_routes(app)
@@ -109,41 +227,103 @@ def register_routes(app: Flask) -> None:
 
         return wrapped_view
 
+    def password_fingerprint(user: User) -> str:
+        # Ties the session to the password hash it was verified against, so
+        # later requests can trust it without repeating the bcrypt check.
+        key = app.secret_key
+        if isinstance(key, str):
+            key = key.encode("utf-8")
+        message = f"{user.id}:{user.password_hash}".encode("utf-8")
+        return hmac.new(key, message, "sha256").hexdigest()
+
     def login_user(user: User) -> None:
+        # Leaves the commit to the caller so login and its activity log
+        # entry are written in one transaction.
         session["user_id"] = user.id
+        session["pw_fp"] = password_fingerprint(user)
         session.permanent = True
-        now_utc = datetime.now(timezone.utc)
+        g.user = user
+        now_utc = utcnow()
         user.last_login_at = now_utc
         user.last_active_at = now_utc
-        db.session.commit()
 
     ROUTINE_ACTIONS = {"view_dashboard", "view_admin_panel"}
+    ACTIVE_WRITE_INTERVAL = timedelta(seconds=60)
+
+    def commit_with_activity_logs() -> None:
+        # Inserts queued activity entries and commits them together with the
+        # caller's own changes in a single transaction.
+        pending = g.pop("pending_activity_logs", None)
+        if pending:
+            db.session.execute(insert(ActivityLog), pending)
+        db.session.commit()
 
-    def track_activity(action: str, description: str | None = None, details: dict | None = None) -> None:
+    def track_activity(
+        action: str,
+        description: str | None = None,
+        details: dict | None = None,
+    ) -> None:
         if not g.user:
             return
-        g.user.last_active_at = datetime.now(timezone.utc)
+        now_utc = utcnow()
         if action in ROUTINE_ACTIONS:
+            # Page views only refresh last_active_at; skip the write while the
+            # stored value is still recent to avoid an UPDATE per pageview.
+            last_active = g.user.last_active_at
+            if last_active is not None:
+                if last_active.tzinfo is None:
+                    last_active = last_active.replace(tzinfo=timezone.utc)
+                if now_utc - last_active < ACTIVE_WRITE_INTERVAL:
+                    return
+            g.user.last_active_at = now_utc
             db.session.commit()
             return
-        entry = ActivityLog(
-            user_id=g.user.id,
-            action=action,
-            description=description,
-            details=details or {},
+        g.user.last_active_at = now_utc
+        # Written by the caller's commit_with_activity_logs(), or in one batch
+        # when the request is torn down.
+        g.setdefault("pending_activity_logs", []).append(
+            {
+                "user_id": g.user.id,
+                "action": action,
+                "description": description,
+                "details": details or {},
+                "created_at": now_utc,
+            }
         )
-        db.session.add(entry)
-        db.session.commit()
 
     def logout_user() -> None:
         session.pop("user_id", None)
+        session.pop("pw_fp", None)
 
     @app.before_request
     def load_logged_in_user() -> None:
         user_id = session.get("user_id")
-        g.user = User.query.get(user_id) if user_id else None
+        g.user = db.session.get(User, user_id) if user_id else None
         if user_id and g.user is None:
-            session.pop("user_id", None)
+            logout_user()
+            return
+        fingerprint = session.get("pw_fp")
+        if g.user and fingerprint is not None and not hmac.compare_digest(
+            fingerprint, password_fingerprint(g.user)
+        ):
+            # The password changed since this session signed in.
+            g.user = None
+            logout_user()
+
+    @app.teardown_request
+    def flush_activity_logs(exc: BaseException | None) -> None:
+        pending = g.get("pending_activity_logs")
+        if not pending:
+            return
+        if exc is not None:
+            g.pop("pending_activity_logs")
+            db.session.rollback()
+            return
+        try:
+            commit_with_activity_logs()
+        except SQLAlchemyError:
+            db.session.rollback()
+            app.logger.exception("Failed to write %d activity log entries", len(pending))
 
     @app.route("/signup", methods=["GET", "POST"])
     def signup():
@@ -163,11 +343,12 @@ def register_routes(app: Flask) -> None:
                 user = User(
                     email=email,
                     username=username,
-                    password_hash=generate_password_hash(password),
+                    password_hash=hash_password(password),
                 )
                 db.session.add(user)
-                db.session.commit()
+                db.session.flush()
                 login_user(user)
+                db.session.commit()
                 flash("Account created successfully.", "success")
                 return redirect(url_for("dashboard"))
         return render_template("signup.html")
@@ -185,11 +366,17 @@ def register_routes(app: Flask) -> None:
                     user = User.query.filter_by(email=identifier.lower()).first()
                 else:
                     user = User.query.filter_by(username=identifier.lower()).first()
-            if not user or not check_password_hash(user.password_hash, password):
+            if not user:
+                verify_password(_DUMMY_PASSWORD_HASH, password)
+                flash("Invalid credentials.", "error")
+            elif not verify_password(user.password_hash, password):
                 flash("Invalid credentials.", "error")
             else:
+                if password_needs_rehash(user.password_hash):
+                    user.password_hash = hash_password(password)
                 login_user(user)
                 track_activity("login", "User signed in")
+                commit_with_activity_logs()
                 next_url = request.args.get("next")
                 if not next_url:
                     next_url = url_for("admin_panel") if user.is_admin else url_for("dashboard")
@@ -217,8 +404,11 @@ def register_routes(app: Flask) -> None:
     def admin_activity_feed():
         limit = min(int(request.args.get("limit", 50) or 50), 200)
         user_filter = request.args.get("user_id", type=int)
+        # The join is needed for the is_admin filter anyway, so fill
+        # ActivityLog.user from it rather than a separate selectin query.
         query = (
             ActivityLog.query.join(User)
+            .options(contains_eager(ActivityLog.user))
             .filter(User.is_admin.is_(False))
             .filter(~ActivityLog.action.in_(ROUTINE_ACTIONS))
         )
@@ -227,7 +417,7 @@ def register_routes(app: Flask) -> None:
         logs = query.order_by(ActivityLog.created_at.desc()).limit(limit).all()
         payload = []
         for log in logs:
-            item = log.to_dict()
+            item = log.to_dict(ist_labels=False)
             item["username"] = log.user.username if log.user else "Unknown"
             payload.append(item)
         return jsonify(payload)
@@ -236,93 +426,185 @@ def register_routes(app: Flask) -> None:
     @login_required
     @admin_required
     def admin_summary():
-        users = (
-            User.query.filter(User.is_admin.is_(False))
-            .order_by(User.created_at.asc())
-            .all()
-        )
         summary = []
-        for account in users:
-            task_query = Task.query.filter_by(user_id=account.id)
-            total_tasks = task_query.count()
-            completed_tasks = task_query.filter_by(status="done").count()
-            total_sessions = PomodoroSession.query.filter_by(user_id=account.id).count()
-            total_focus = (
-                db.session.query(func.coalesce(func.sum(PomodoroSession.duration), 0))
-                .filter_by(user_id=account.id)
-                .scalar()
-            )
+        for account, total_tasks, completed_tasks, total_sessions, total_focus in (
+            _admin_summary_rows()
+        ):
             summary.append(
                 {
                     "id": account.id,
                     "username": account.username,
                     "email": account.email,
                     "is_admin": account.is_admin,
-                    "created_at": to_utc_iso(account.created_at),
-                    "created_at_ist": to_ist_string(account.created_at),
-                    "last_login_at": account.last_login_at.isoformat()
-                    if account.last_login_at
-                    else None,
-                    "last_login_at_ist": to_ist_string(account.last_login_at),
-                    "last_active_at": account.last_active_at.isoformat()
-                    if account.last_active_at
-                    else None,
-                    "last_active_at_ist": to_ist_string(account.last_active_at),
-                    "total_tasks": total_tasks,
-                    "completed_tasks": completed_tasks,
-                    "total_sessions": total_sessions,
+                    "created_at": account.created_at,
+                    "created_at_ist": naive_utc_to_ist_string(account.created_at),
+                    "last_login_at": account.last_login_at,
+                    "last_login_at_ist": naive_utc_to_ist_string(account.last_login_at),
+                    "last_active_at": account.last_active_at,
+                    "last_active_at_ist": naive_utc_to_ist_string(account.last_active_at),
+                    "total_tasks": total_tasks or 0,
+                    "completed_tasks": int(completed_tasks or 0),
+                    "total_sessions": total_sessions or 0,
                     "total_focus_minutes": int((total_focus or 0) / 60),
                 }
             )
         return jsonify(summary)
 
+    def _admin_summary_rows() -> list[tuple]:
+        primary_engine = db.engines[None]
+        auth_engine = db.engines["auth"]
+        if primary_engine.dialect.name == "postgresql" and primary_engine.url == auth_engine.url:
+            return _admin_summary_rows_cte()
+        users = (
+            User.query.filter(User.is_admin.is_(False))
+            .order_by(User.created_at.asc())
+            .all()
+        )
+        task_stats = {
+            user_id: (total, done)
+            for user_id, total, done in db.session.query(
+                Task.user_id,
+                func.count(Task.id),
+                func.sum(case((Task.status == "done", 1), else_=0)),
+            )
+            .group_by(Task.user_id)
+            .all()
+        }
+        pomodoro_stats = {
+            user_id: (sessions, focus)
+            for user_id, sessions, focus in db.session.query(
+                PomodoroSession.user_id,
+                func.count(PomodoroSession.id),
+                func.coalesce(func.sum(PomodoroSession.duration), 0),
+            )
+            .group_by(PomodoroSession.user_id)
+            .all()
+        }
+        return [
+            (account, *task_stats.get(account.id, (0, 0)), *pomodoro_stats.get(account.id, (0, 0)))
+            for account in users
+        ]
+
+    def _admin_summary_rows_cte() -> list[tuple]:
+        # Users live in the auth bind; joining them to tasks in one statement
+        # is only possible when both binds point at the same Postgres database.
+        task_totals = (
+            select(
+                Task.user_id,
+                func.count(Task.id).label("total"),
+                func.count(Task.id).filter(Task.status == "done").label("done"),
+            )
+            .group_by(Task.user_id)
+            .cte("task_totals")
+        )
+        pomodoro_totals = (
+            select(
+                PomodoroSession.user_id,
+                func.count(PomodoroSession.id).label("sessions"),
+                func.coalesce(func.sum(PomodoroSession.duration), 0).label("focus"),
+            )
+            .group_by(PomodoroSession.user_id)
+            .cte("pomodoro_totals")
+        )
+        stmt = (
+            select(
+                User,
+                task_totals.c.total,
+                task_totals.c.done,
+                pomodoro_totals.c.sessions,
+                pomodoro_totals.c.focus,
+            )
+            .outerjoin(task_totals, task_totals.c.user_id == User.id)
+            .outerjoin(pomodoro_totals, pomodoro_totals.c.user_id == User.id)
+            .where(User.is_admin.is_(False))
+            .order_by(User.created_at.asc())
+        )
+        return [tuple(row) for row in db.session.execute(stmt)]
+
     @app.route("/profile")
     @login_required
     def profile():
-        total_tasks = Task.query.filter_by(user_id=g.user.id).count()
-        completed_tasks = Task.query.filter_by(user_id=g.user.id, status="done").count()
-        total_sessions = PomodoroSession.query.filter_by(user_id=g.user.id).count()
-        total_focus = (
-            db.session.query(func.coalesce(func.sum(PomodoroSession.duration), 0))
-            .filter_by(user_id=g.user.id)
-            .scalar()
+        total_tasks, completed_tasks = (
+            db.session.query(
+                func.count(Task.id),
+                func.coalesce(func.sum(case((Task.status == "done", 1), else_=0)), 0),
+            )
+            .filter(Task.user_id == g.user.id)
+            .one()
+        )
+        total_sessions, total_focus = (
+            db.session.query(
+                func.count(PomodoroSession.id),
+                func.coalesce(func.sum(PomodoroSession.duration), 0),
+            )
+            .filter(PomodoroSession.user_id == g.user.id)
+            .one()
         )
         return render_template(
             "profile.html",
             user=g.user,
-            joined_at_ist=to_ist_string(g.user.created_at),
+            joined_at_ist=naive_utc_to_ist_string(g.user.created_at),
             total_tasks=total_tasks,
-            completed_tasks=completed_tasks,
+            completed_tasks=int(completed_tasks),
             total_sessions=total_sessions,
             total_focus_minutes=int((total_focus or 0) / 60),
         )
 
-    @app.route("/")
-    @login_required
-    def dashboard():
-        if g.user.is_admin:
-            return redirect(url_for("admin_panel"))
-        today_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+    def tasks_version(user_id: int) -> int:
+        version = cache.get(f"tasks_version:{user_id}")
+        if version is None:
+            # A missing or evicted version gets a fresh value instead of a
+            # default, so it can never match a fragment rendered earlier.
+            version = bump_tasks_version(user_id)
+        return version
+
+    def bump_tasks_version(user_id: int) -> int:
+        version = time_ns()
+        cache.set(f"tasks_version:{user_id}", version, timeout=TASKS_VERSION_TTL)
+        return version
+
+    # Rendered pages are keyed on user_id as well as the version, so one
+    # user's HTML can never be served to another.
+    @cache.memoize(timeout=FRAGMENT_CACHE_TTL)
+    def render_dashboard(user_id: int, version: int, today_start: datetime) -> str:
         today_tasks = (
-            Task.query.filter(Task.user_id == g.user.id)
+            Task.query.filter(Task.user_id == user_id)
             .filter(Task.created_at >= today_start)
             .filter(Task.status != "done")
             .order_by(Task.created_at.desc())
             .all()
         )
-        stats_payload = get_recent_stats(user_id=g.user.id, days=7)
-        track_activity("view_dashboard", "Viewed dashboard")
         return render_template(
             "dashboard.html",
             tasks=[task.to_dict() for task in today_tasks],
-            stats=stats_payload,
             work_duration_minutes=25,
             break_duration_minutes=5,
             user=g.user,
         )
 
+    @cache.memoize(timeout=FRAGMENT_CACHE_TTL)
+    def render_completed_tasks(user_id: int, version: int) -> str:
+        grouped = _get_completed_tasks(user_id)
+        return render_template(
+            "completed_tasks.html",
+            grouped_tasks=grouped,
+            user=g.user,
+        )
+
+    @app.route("/")
+    @login_required
+    def dashboard():
+        if g.user.is_admin:
+            return redirect(url_for("admin_panel"))
+        today_start = utcnow().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        track_activity("view_dashboard", "Viewed dashboard")
+        # Flashed messages are part of the page and consumed on render.
+        if "_flashes" in session:
+            return render_dashboard.uncached(g.user.id, None, today_start)
+        return render_dashboard(g.user.id, tasks_version(g.user.id), today_start)
+
     @app.get("/tasks")
     @login_required_json
     def list_tasks():
@@ -332,18 +614,13 @@ def register_routes(app: Flask) -> None:
             .order_by(Task.created_at.desc())
             .all()
         )
-        return jsonify([task.to_dict() for task in tasks])
+        return jsonify([task.to_dict(ist_labels=False) for task in tasks])
 
     @app.route("/completed")
     @app.route("/completed-tasks")
     @login_required
     def completed_tasks_page():
-        grouped = _get_completed_tasks(g.user.id)
-        return render_template(
-            "completed_tasks.html",
-            grouped_tasks=grouped,
-            user=g.user,
-        )
+        return render_completed_tasks(g.user.id, tasks_version(g.user.id))
 
     @app.get("/api/tasks/completed")
     @login_required_json
@@ -352,52 +629,46 @@ def register_routes(app: Flask) -> None:
         return jsonify(grouped)
 
     def _get_completed_tasks(user_id: int) -> dict:
-        completed = (
-            Task.query.filter_by(user_id=user_id, status="done")
+        rows = db.session.execute(
+            select(Task.id, Task.title, Task.created_at)
+            .where(Task.user_id == user_id, Task.status == "done")
             .order_by(Task.created_at.desc())
-            .all()
-        )
-        month_map: OrderedDict[str, dict] = OrderedDict()
-        total = 0
-        for task in completed:
-            ist_dt = to_ist_datetime(task.created_at)
-            if not ist_dt:
-                continue
-            month_label = ist_dt.strftime("%B %Y")
-            day_key = ist_dt.date()
-            day_label = ist_dt.strftime("%d %b %Y (%A)")
-            month_entry = month_map.setdefault(
-                month_label,
-                {"month_label": month_label, "total_tasks": 0, "days": OrderedDict()},
-            )
-            day_entry = month_entry["days"].setdefault(
-                day_key,
-                {
-                    "date_label": day_label,
-                    "tasks": [],
-                },
-            )
-            task_info = {
-                "id": task.id,
-                "title": task.title,
-                "created_at": to_utc_iso(task.created_at),
-                "created_at_ist": to_ist_string(task.created_at),
-                "time_label": ist_dt.strftime("%I:%M %p"),
-            }
-            day_entry["tasks"].append(task_info)
-            month_entry["total_tasks"] += 1
-            total += 1
-
+        ).all()
+        # Rows arrive newest first, so each month and day is a contiguous run.
+        ist = naive_utc_to_ist_datetime
+        entries = [(ist(row.created_at), row) for row in rows if row.created_at]
         months = []
-        for month_entry in month_map.values():
+        for _, month_rows in groupby(entries, key=lambda e: (e[0].year, e[0].month)):
+            month_rows = list(month_rows)
             days = []
-            for day_entry in month_entry["days"].values():
-                day_entry["tasks_count"] = len(day_entry["tasks"])
-                days.append(day_entry)
-            month_entry["days"] = days
-            months.append(month_entry)
+            for _, day_rows in groupby(month_rows, key=lambda e: e[0].date()):
+                day_rows = list(day_rows)
+                tasks = [
+                    {
+                        "id": row.id,
+                        "title": row.title,
+                        "created_at": row.created_at,
+                        "created_at_ts": to_epoch(row.created_at),
+                        "time_label": ist_dt.strftime(TIME_LABEL_FORMAT),
+                    }
+                    for ist_dt, row in day_rows
+                ]
+                days.append(
+                    {
+                        "date_label": day_rows[0][0].strftime(DAY_LABEL_FORMAT),
+                        "tasks": tasks,
+                        "tasks_count": len(tasks),
+                    }
+                )
+            months.append(
+                {
+                    "month_label": month_rows[0][0].strftime(MONTH_LABEL_FORMAT),
+                    "total_tasks": sum(day["tasks_count"] for day in days),
+                    "days": days,
+                }
+            )
 
-        return {"total_completed": total, "months": months}
+        return {"total_completed": len(entries), "months": months}
 
     @app.post("/add")
     @login_required_json
@@ -409,9 +680,11 @@ def register_routes(app: Flask) -> None:
             return jsonify({"error": "Title is required"}), 400
         task = Task(title=title, status=status, user_id=g.user.id)
         db.session.add(task)
-        db.session.commit()
+        db.session.flush()
         track_activity("task_created", f"Created task '{title}'", {"task_id": task.id})
-        return jsonify(task.to_dict()), 201
+        commit_with_activity_logs()
+        bump_tasks_version(g.user.id)
+        return jsonify(task.to_dict(ist_labels=False)), 201
 
     @app.post("/update/<int:task_id>")
     @login_required_json
@@ -429,13 +702,14 @@ def register_routes(app: Flask) -> None:
             task.title = title
         if status is not None:
             task.status = status
-        db.session.commit()
         track_activity(
             "task_updated",
             f"Updated task '{task.title}'",
             {"task_id": task.id, "status": task.status},
         )
-        return jsonify(task.to_dict())
+        commit_with_activity_logs()
+        bump_tasks_version(g.user.id)
+        return jsonify(task.to_dict(ist_labels=False))
 
     @app.post("/delete/<int:task_id>")
     @login_required_json
@@ -444,8 +718,11 @@ def register_routes(app: Flask) -> None:
         if not task:
             abort(404)
         db.session.delete(task)
-        db.session.commit()
         track_activity("task_deleted", f"Deleted task '{task.title}'", {"task_id": task.id})
+        commit_with_activity_logs()
+        bump_tasks_version(g.user.id)
+        # The task's pomodoro sessions are removed with it by the cascade.
+        invalidate_recent_stats(g.user.id)
         return jsonify({"success": True})
 
     @app.post("/api/pomodoro/start")
@@ -460,20 +737,21 @@ def register_routes(app: Flask) -> None:
         session_record = PomodoroSession(
             task_id=task_id,
             user_id=g.user.id,
-            start_time=datetime.now(timezone.utc),
+            start_time=utcnow(),
         )
         db.session.add(session_record)
-        db.session.commit()
+        db.session.flush()
         track_activity(
             "pomodoro_started",
             "Started Pomodoro session",
             {"session_id": session_record.id, "task_id": task_id},
         )
+        commit_with_activity_logs()
         return (
             jsonify(
                 {
                     "session_id": session_record.id,
-                    "start_time": session_record.start_time.isoformat(),
+                    "start_time": session_record.start_time,
                 }
             ),
             201,
@@ -491,14 +769,13 @@ def register_routes(app: Flask) -> None:
             return jsonify({"error": "Session already ended"}), 400
         payload = request.get_json(silent=True) or {}
         duration = payload.get("duration")
-        session_record.end_time = datetime.now(timezone.utc)
+        session_record.end_time = utcnow()
         if duration is not None:
             session_record.duration = int(duration)
         elif session_record.start_time:
             session_record.duration = int(
                 (session_record.end_time - session_record.start_time).total_seconds()
             )
-        db.session.commit()
         track_activity(
             "pomodoro_completed",
             "Completed Pomodoro session",
@@ -508,6 +785,8 @@ def register_routes(app: Flask) -> None:
                 "duration": session_record.duration,
             },
         )
+        commit_with_activity_logs()
+        invalidate_recent_stats(g.user.id)
         return jsonify(session_record.to_dict())
 
     @app.get("/api/pomodoro/stats")
@@ -517,8 +796,32 @@ def register_routes(app: Flask) -> None:
         return jsonify(stats_payload)
 
 
+STATS_CACHE_TTL = 30  # seconds
+STATS_CACHE_MAX_ENTRIES = 10_000
+# Keyed by user_id so invalidation is a single pop, which is safe while other
+# threads insert; each entry records the (days, IST date) it was computed for.
+_stats_cache: dict[int | None, tuple[float, tuple, List[dict]]] = {}
+
+
+def invalidate_recent_stats(user_id: int) -> None:
+    _stats_cache.pop(user_id, None)
+
+
 def get_recent_stats(user_id: int | None = None, days: int = 7) -> List[dict]:
-    tz_now = datetime.now(timezone.utc).astimezone(IST)
+    tz_now = datetime.now(IST)
+    window = (days, tz_now.date())
+    cached = _stats_cache.get(user_id)
+    now_mono = monotonic()
+    if cached and cached[0] > now_mono and cached[1] == window:
+        return cached[2]
+    stats = _query_recent_stats(tz_now, user_id, days)
+    if len(_stats_cache) >= STATS_CACHE_MAX_ENTRIES:
+        _stats_cache.clear()
+    _stats_cache[user_id] = (now_mono + STATS_CACHE_TTL, window, stats)
+    return stats
+
+
+def _query_recent_stats(tz_now: datetime, user_id: int | None, days: int) -> List[dict]:
     window_start = tz_now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
         days=days - 1
     )
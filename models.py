@@ -1,12 +1,20 @@
 from datetime import datetime, timezone, timedelta
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.postgresql import JSONB
 
 
 db = SQLAlchemy()
 
 
-IST = timezone(timedelta(hours=5, minutes=30))
+IST_OFFSET = timedelta(hours=5, minutes=30)
+IST = timezone(IST_OFFSET)
+IST_STRING_FORMAT = "%d %b %Y, %I:%M %p IST"
+
+
+def utcnow() -> datetime:
+    # Measured faster than datetime.fromtimestamp(time.time(), timezone.utc).
+    return datetime.now(timezone.utc)
 
 
 def _ensure_utc(dt: datetime) -> datetime:
@@ -21,11 +29,17 @@ def to_utc_iso(dt: datetime | None) -> str | None:
     return _ensure_utc(dt).isoformat()
 
 
+def to_epoch(dt: datetime | None) -> int | None:
+    if not dt:
+        return None
+    return int(_ensure_utc(dt).timestamp())
+
+
 def to_ist_string(dt: datetime | None) -> str | None:
     if not dt:
         return None
     ist_dt = _ensure_utc(dt).astimezone(IST)
-    return ist_dt.strftime("%d %b %Y, %I:%M %p IST")
+    return ist_dt.strftime(IST_STRING_FORMAT)
 
 
 def to_ist_datetime(dt: datetime | None) -> datetime | None:
@@ -34,40 +48,63 @@ def to_ist_datetime(dt: datetime | None) -> datetime | None:
     return _ensure_utc(dt).astimezone(IST)
 
 
+def naive_utc_to_ist_datetime(dt: datetime | None) -> datetime | None:
+    # Columns are stored as naive UTC, so shifting by the fixed offset gives
+    # the IST wall time without the tzinfo round-trip. The result is naive.
+    if not dt:
+        return None
+    if dt.tzinfo is not None:
+        return to_ist_datetime(dt)
+    return dt + IST_OFFSET
+
+
+def naive_utc_to_ist_string(dt: datetime | None) -> str | None:
+    if not dt:
+        return None
+    return naive_utc_to_ist_datetime(dt).strftime(IST_STRING_FORMAT)
+
+
 class Task(db.Model):
     __tablename__ = "tasks"
+    __table_args__ = (
+        db.Index("ix_tasks_user_status_created", "user_id", "status", "created_at"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, nullable=False, index=True)
+    user_id = db.Column(db.Integer, nullable=False)
     title = db.Column(db.String(255), nullable=False)
     status = db.Column(db.String(50), nullable=False, default="pending")
     created_at = db.Column(
-        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+        db.DateTime, default=utcnow, nullable=False
     )
 
     pomodoro_sessions = db.relationship(
         "PomodoroSession", back_populates="task", cascade="all, delete-orphan"
     )
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, ist_labels: bool = True) -> dict:
+        data = {
             "id": self.id,
             "user_id": self.user_id,
             "title": self.title,
             "status": self.status,
-            "created_at": to_utc_iso(self.created_at),
-            "created_at_ist": to_ist_string(self.created_at),
+            "created_at": self.created_at,
+            "created_at_ts": to_epoch(self.created_at),
         }
+        if ist_labels:
+            data["created_at_ist"] = naive_utc_to_ist_string(self.created_at)
+        return data
 
 
 class PomodoroSession(db.Model):
     __tablename__ = "pomodoro_sessions"
+    __table_args__ = (db.Index("ix_pomo_user_start", "user_id", "start_time"),)
 
     id = db.Column(db.Integer, primary_key=True)
     task_id = db.Column(db.Integer, db.ForeignKey("tasks.id"), nullable=True)
-    user_id = db.Column(db.Integer, nullable=False, index=True)
+    user_id = db.Column(db.Integer, nullable=False)
     start_time = db.Column(
-        db.DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+        db.DateTime, nullable=False, default=utcnow
     )
     end_time = db.Column(db.DateTime, nullable=True)
     duration = db.Column(db.Integer, nullable=True)  # duration in seconds
@@ -79,10 +116,10 @@ class PomodoroSession(db.Model):
             "id": self.id,
             "task_id": self.task_id,
             "user_id": self.user_id,
-            "start_time": to_utc_iso(self.start_time),
-            "end_time": to_utc_iso(self.end_time),
-            "start_time_ist": to_ist_string(self.start_time),
-            "end_time_ist": to_ist_string(self.end_time),
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "start_time_ist": naive_utc_to_ist_string(self.start_time),
+            "end_time_ist": naive_utc_to_ist_string(self.end_time),
             "duration": self.duration,
         }
 
@@ -97,7 +134,7 @@ class User(db.Model):
     password_hash = db.Column(db.String(255), nullable=False)
     is_admin = db.Column(db.Boolean, nullable=False, default=False)
     created_at = db.Column(
-        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+        db.DateTime, default=utcnow, nullable=False
     )
     last_login_at = db.Column(db.DateTime, nullable=True)
     last_active_at = db.Column(db.DateTime, nullable=True)
@@ -115,20 +152,25 @@ class ActivityLog(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     action = db.Column(db.String(120), nullable=False)
     description = db.Column(db.String(255), nullable=True)
-    details = db.Column(db.JSON, nullable=False, default=dict)
+    details = db.Column(
+        db.JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=dict
+    )
     created_at = db.Column(
-        db.DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+        db.DateTime, default=utcnow, nullable=False
     )
 
     user = db.relationship("User", back_populates="activity_logs")
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, ist_labels: bool = True) -> dict:
+        data = {
             "id": self.id,
             "user_id": self.user_id,
             "action": self.action,
             "description": self.description,
             "details": self.details or {},
-            "created_at": to_utc_iso(self.created_at),
-            "created_at_ist": to_ist_string(self.created_at),
+            "created_at": self.created_at,
+            "created_at_ts": to_epoch(self.created_at),
         }
+        if ist_labels:
+            data["created_at_ist"] = naive_utc_to_ist_string(self.created_at)
+        return data
@@ -36,7 +36,7 @@ function renderTasks(tasks) {
   tasks.forEach(task => {
     const li = document.createElement('li');
     li.classList.add('flex', 'items-center', 'justify-between', 'p-3', 'rounded-lg', 'bg-slate-800/60', 'border', 'border-slate-700/60');
-    const createdLabel = task.created_at_ist || new Date(task.created_at).toLocaleString();
+    const createdLabel = formatIstTimestamp(task.created_at_ts);
     li.innerHTML = `
       <div class="flex flex-col">
         <span class="font-semibold">${task.title}</span>
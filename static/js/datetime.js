@@ -0,0 +1,20 @@
+// Formats epoch seconds like the server's to_ist_string:
+// '15 Oct 2026, 09:46 AM IST'.
+const istFormatter = new Intl.DateTimeFormat('en-US', {
+  timeZone: 'Asia/Kolkata',
+  day: '2-digit',
+  month: 'short',
+  year: 'numeric',
+  hour: '2-digit',
+  minute: '2-digit',
+  hourCycle: 'h12'
+});
+
+function formatIstTimestamp(timestamp) {
+  if (timestamp == null) return '';
+  const parts = {};
+  istFormatter.formatToParts(new Date(timestamp * 1000)).forEach(({type, value}) => {
+    parts[type] = value;
+  });
+  return `${parts.day} ${parts.month} ${parts.year}, ${parts.hour}:${parts.minute} ${parts.dayPeriod.toUpperCase()} IST`;
+}